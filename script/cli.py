@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import sys
+from contextlib import nullcontext
 from pathlib import Path
 
 from script.config_loader import ConfigLoader
 
 from script.core.engine import DocxLint
-from script.reporters.json_reporter import render_json
-from script.reporters.markdown_reporter import render_markdown
+from script.reporters.json_reporter import write_json
+from script.reporters.markdown_reporter import write_markdown
 
 
 def parse_args() -> argparse.Namespace:
@@ -36,15 +38,15 @@ def main() -> int:
 
     issues = DocxLint(config=config).run(str(docx_path))
 
-    if args.format == "json":
-        out_text = render_json(issues)
-    else:
-        out_text = render_markdown(issues)
-
-    if args.out:
-        Path(args.out).write_text(out_text, encoding="utf-8")
-    else:
-        print(out_text)
+    # Write straight to the destination rather than materialising the report first
+    out_ctx = open(args.out, "w", encoding="utf-8") if args.out else nullcontext(sys.stdout)
+    with out_ctx as out:
+        if args.format == "json":
+            write_json(issues, out)
+        else:
+            write_markdown(issues, out)
+        if not args.out:
+            out.write("\n")
 
     return 0
 
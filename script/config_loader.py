@@ -3,13 +3,33 @@
 Configuration file loading and parsing module.
 """
 
+import copy
 import yaml
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import re
 
 
+# Parsed YAML files shared by all loaders in this process.
+# Maps resolved path -> ((mtime_ns, size), parsed data); an entry is reused
+# only while the file on disk is unchanged.
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+# Use libyaml's C parser when PyYAML was built with it; same safe semantics,
+# several times faster than the pure-Python SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Keys whose list values are concatenated (not replaced) by _deep_merge
+_LIST_MERGE_KEYS = frozenset({"rules", "classifiers"})
+
+# Valid values of position.type in classifier rules
+_POSITION_TYPES = frozenset({"absolute", "relative", "between", "next", "prev"})
+
+# WD_ALIGN_PARAGRAPH member names that alignment_aliases may refer to
+_ALIGNMENT_ENUM_NAMES = frozenset({"CENTER", "LEFT", "RIGHT", "JUSTIFY", "DISTRIBUTE"})
+
+
 class ConfigError(Exception):
     """Configuration error exception."""
 
@@ -100,15 +120,14 @@ class ConfigLoader:
 
         loaded_files.add(str(file_path))
 
-        if not file_path.exists():
-            raise ConfigError(f"Configuration file not found: {file_path}")
-
+        # No separate exists() probe: the stat in _read_yaml reports a missing file
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = self._read_yaml(file_path)
+        except FileNotFoundError:
+            raise ConfigError(f"Configuration file not found: {file_path}") from None
         except yaml.YAMLError as e:
             raise ConfigError(f"Error parsing YAML file {file_path}: {e}")
-        except Exception as e:
+        except (OSError, UnicodeDecodeError) as e:
             raise ConfigError(f"Error reading configuration file {file_path}: {e}")
 
         if config is None:
@@ -134,6 +153,25 @@ class ConfigLoader:
         loaded_files.remove(str(file_path))
         return config
 
+    def _read_yaml(self, file_path: Path) -> Any:
+        """
+        Parse a YAML file, reusing the cached result while the file is unchanged.
+
+        Args:
+            file_path: Resolved path to YAML file
+
+        Returns:
+            A private copy of the parsed data (callers may mutate it freely)
+        """
+        stat = file_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _YAML_CACHE.get(str(file_path))
+        if cached is None or cached[0] != signature:
+            with open(file_path, "r", encoding="utf-8") as f:
+                cached = (signature, yaml.load(f, Loader=_YAML_LOADER))
+            _YAML_CACHE[str(file_path)] = cached
+        return copy.deepcopy(cached[1])
+
     def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deep merge two dictionaries, with override taking precedence.
@@ -149,7 +187,7 @@ class ConfigLoader:
         for key, value in override.items():
             # 对于列表类型的配置项，进行合并（追加）而不是覆盖
             # 适用于：rules, classifiers, styles（如果是列表）
-            if key in ["rules", "classifiers"] and isinstance(result.get(key), list) and isinstance(value, list):
+            if key in _LIST_MERGE_KEYS and isinstance(result.get(key), list) and isinstance(value, list):
                 result[key] = list(result.get(key) or []) + list(value or [])
                 continue
             # 对于字典类型，递归合并
@@ -177,10 +215,8 @@ class ConfigLoader:
                 "Configuration file path is required. Please specify a config file using --config option."
             )
 
+        # A missing file is reported by _load_yaml_with_imports when it is read
         config_file = Path(self.config_path)
-        if not config_file.exists():
-            raise ConfigError(f"Configuration file not found: {config_file}")
-
         self.config = self._load_yaml_with_imports(config_file)
         self._validate_config()
         self._apply_extensions()
@@ -201,18 +237,10 @@ class ConfigLoader:
             from script.core.style_checker import StyleChecker
             from docx.enum.text import WD_ALIGN_PARAGRAPH
             
-            # 对齐方式枚举映射
-            alignment_enums = {
-                'CENTER': WD_ALIGN_PARAGRAPH.CENTER,
-                'LEFT': WD_ALIGN_PARAGRAPH.LEFT,
-                'RIGHT': WD_ALIGN_PARAGRAPH.RIGHT,
-                'JUSTIFY': WD_ALIGN_PARAGRAPH.JUSTIFY,
-                'DISTRIBUTE': WD_ALIGN_PARAGRAPH.DISTRIBUTE,
-            }
-            
+            # 允许的枚举名称集合在模块级预先构建，这里只做成员判断
             for alias, enum_name in document_config['alignment_aliases'].items():
-                if enum_name in alignment_enums:
-                    StyleChecker.register_alignment_alias(alias, alignment_enums[enum_name])
+                if isinstance(enum_name, str) and enum_name in _ALIGNMENT_ENUM_NAMES:
+                    StyleChecker.register_alignment_alias(alias, getattr(WD_ALIGN_PARAGRAPH, enum_name))
         
         # 应用字符宽度比例
         if 'char_width_ratio' in document_config:
@@ -337,7 +365,7 @@ class ConfigLoader:
             pos_type = position["type"]
             
             # 验证 type 字段
-            if pos_type not in ["absolute", "relative", "between", "next", "prev"]:
+            if not isinstance(pos_type, str) or pos_type not in _POSITION_TYPES:
                 raise ConfigError(
                     f"{context}: position.type 必须是 'absolute', 'relative', 'between', 'next' 或 'prev'，"
                     f"当前值为 '{pos_type}'"
@@ -449,10 +477,8 @@ def load_config(config_path: str) -> Dict[str, Any]:
     Raises:
         ConfigError: If configuration cannot be loaded.
     """
-    if not config_path:
-        raise ConfigError("config_path is required and cannot be None or empty")
-    loader = ConfigLoader(config_path)
-    return loader.load()
+    # ConfigLoader validates config_path itself
+    return ConfigLoader(config_path).load()
 
 
 if __name__ == "__main__":
@@ -467,8 +493,10 @@ if __name__ == "__main__":
         config_path = sys.argv[1]
         loader = ConfigLoader(config_path)
         config = loader.load()
+        document_config = config["document"]
         print("Configuration loaded successfully!")
-        print(f"Enabled checks: {', '.join(loader.get_all_enabled_checks())}")
+        print(f"Classifiers: {len(document_config.get('classifiers', []))}")
+        print(f"Styles: {len(document_config.get('styles', {}))}")
     except ConfigError as e:
         print(f"Error loading configuration: {e}")
         sys.exit(1)
@@ -7,14 +7,85 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from script.core.model import Block, ParagraphBlock, TableBlock
 
+# type 配置值 -> 元素类
+_BLOCK_TYPES = {
+    "paragraph": ParagraphBlock,
+    "table": TableBlock,
+}
+
+# 区间表达式的括号字符，如 "(author-list, corresponding-author)"
+_RANGE_BRACKETS = frozenset("()[]")
+
+# 区间表达式：(class1, class2) 或 [class1, class2]
+_RANGE_EXPR_RE = re.compile(r'[\[\(]\s*(\w+(?:-\w+)*)\s*,\s*(\w+(?:-\w+)*)\s*[\]\)]')
+
+
+def _dig(config: Any, *keys: str) -> Any:
+    """按路径读取嵌套配置，任一层缺失或不是字典时返回 None
+
+    Examples:
+        _dig({"range": {"after": {"class": "title"}}}, "range", "after", "class")  # "title"
+    """
+    for key in keys:
+        if not isinstance(config, dict) or key not in config:
+            return None
+        config = config[key]
+    return config
+
+
+def _find_anchor(anchor_def: Dict[str, Any], context: List[Block]) -> Optional[Block]:
+    """查找锚点元素（RelativeMatcher 与 RangeMatcher 共用）
+
+    Args:
+        anchor_def: 锚点定义（如 {class: 'title'}、{position: 0} 或 {pattern: '^摘要'}）
+        context: 所有元素列表
+
+    Returns:
+        第一个符合定义的元素，找不到时返回 None
+    """
+    if "class" in anchor_def:
+        # 通过 class 查找
+        class_name = anchor_def["class"]
+        for block in context:
+            if block.has_class(class_name):
+                return block
+
+    elif "position" in anchor_def:
+        # 通过绝对位置查找
+        position: int = anchor_def["position"]
+        if position < 0:
+            position = len(context) + position
+
+        # Walker 产出的列表中下标即 index，先直接命中，失败时才线性查找
+        if 0 <= position < len(context) and context[position].index == position:
+            return context[position]
+
+        for block in context:
+            if block.index == position:
+                return block
+
+    elif "pattern" in anchor_def:
+        # 通过内容模式查找
+        pattern = re.compile(anchor_def["pattern"])
+        for block in context:
+            if isinstance(block, ParagraphBlock):
+                if pattern.match(block.text):
+                    return block
+
+    return None
+
 
 class Matcher(ABC):
     """匹配器基类"""
 
+    # 是否最多只能匹配一个元素（按 block.index 精确定位的匹配器）。
+    # 规则中只要有一个这样的匹配器，找到第一个匹配元素后即可停止扫描。
+    unique: bool = False
+
     @abstractmethod
     def match(self, block: Block, context: List[Block]) -> bool:
         """判断元素是否匹配
@@ -41,6 +112,8 @@ class PositionMatcher(Matcher):
         position: "last"  # 最后一个（字符串形式）
     """
 
+    unique = True
+
     def __init__(self, position):
         self.position = position
 
@@ -79,8 +152,7 @@ class PatternMatcher(Matcher):
         if not isinstance(block, ParagraphBlock):
             return False
 
-        text = block.paragraph.text or ""
-        return bool(self.pattern.match(text))
+        return bool(self.pattern.match(block.text))
 
 
 class TypeMatcher(Matcher):
@@ -95,13 +167,12 @@ class TypeMatcher(Matcher):
 
     def __init__(self, element_type: str):
         self.element_type = element_type
+        # 类型名在构造时解析为元素类，match 时只需一次 isinstance
+        self._block_type = _BLOCK_TYPES.get(element_type)
 
     def match(self, block: Block, context: List[Block]) -> bool:
-        if self.element_type == "paragraph":
-            return isinstance(block, ParagraphBlock)
-        elif self.element_type == "table":
-            return isinstance(block, TableBlock)
-        return False
+        block_type = self._block_type
+        return block_type is not None and isinstance(block, block_type)
 
 
 class RelativeMatcher(Matcher):
@@ -115,6 +186,8 @@ class RelativeMatcher(Matcher):
         offset: 0  # 紧接着（默认）
     """
 
+    unique = True
+
     def __init__(self, anchor_def: Dict[str, Any], direction: str, offset: int = 0):
         """
         Args:
@@ -125,10 +198,17 @@ class RelativeMatcher(Matcher):
         self.anchor_def = anchor_def
         self.direction = direction
         self.offset = offset
+        # 锚点缓存：匹配器只在一次规则遍历中使用，遍历期间锚点不变，
+        # 每个 context 只需查找一次（避免逐个 block 重复扫描全文）
+        self._context: Optional[List[Block]] = None
+        self._anchor: Optional[Block] = None
 
     def match(self, block: Block, context: List[Block]) -> bool:
         # 查找锚点
-        anchor = self._find_anchor(context)
+        if context is not self._context:
+            self._context = context
+            self._anchor = _find_anchor(self.anchor_def, context)
+        anchor = self._anchor
         if anchor is None:
             return False
 
@@ -140,36 +220,6 @@ class RelativeMatcher(Matcher):
 
         return block.index == target_index
 
-    def _find_anchor(self, context: List[Block]) -> Optional[Block]:
-        """查找锚点元素"""
-        if "class" in self.anchor_def:
-            # 通过 class 查找
-            class_name = self.anchor_def["class"]
-            for block in context:
-                if block.has_class(class_name):
-                    return block
-
-        elif "position" in self.anchor_def:
-            # 通过绝对位置查找
-            position = self.anchor_def["position"]
-            if position < 0:
-                position = len(context) + position
-
-            for block in context:
-                if block.index == position:
-                    return block
-
-        elif "pattern" in self.anchor_def:
-            # 通过内容模式查找
-            pattern = re.compile(self.anchor_def["pattern"])
-            for block in context:
-                if isinstance(block, ParagraphBlock):
-                    text = block.paragraph.text or ""
-                    if pattern.match(text):
-                        return block
-
-        return None
-
 
 class RangeMatcher(Matcher):
     """范围匹配器
@@ -185,11 +235,19 @@ class RangeMatcher(Matcher):
     def __init__(self, after_anchor: Dict[str, Any], before_anchor: Dict[str, Any]):
         self.after_anchor = after_anchor
         self.before_anchor = before_anchor
+        # 锚点缓存，同 RelativeMatcher
+        self._context: Optional[List[Block]] = None
+        self._anchors: Tuple[Optional[Block], Optional[Block]] = (None, None)
 
     def match(self, block: Block, context: List[Block]) -> bool:
         # 查找两个锚点
-        after_block = self._find_anchor(self.after_anchor, context)
-        before_block = self._find_anchor(self.before_anchor, context)
+        if context is not self._context:
+            self._context = context
+            self._anchors = (
+                _find_anchor(self.after_anchor, context),
+                _find_anchor(self.before_anchor, context),
+            )
+        after_block, before_block = self._anchors
 
         if after_block is None or before_block is None:
             return False
@@ -197,33 +255,6 @@ class RangeMatcher(Matcher):
         # 检查是否在范围内（不包括锚点本身）
         return after_block.index < block.index < before_block.index
 
-    def _find_anchor(self, anchor_def: Dict[str, Any], context: List[Block]) -> Optional[Block]:
-        """查找锚点元素"""
-        if "class" in anchor_def:
-            class_name = anchor_def["class"]
-            for block in context:
-                if block.has_class(class_name):
-                    return block
-
-        elif "position" in anchor_def:
-            position = anchor_def["position"]
-            if position < 0:
-                position = len(context) + position
-
-            for block in context:
-                if block.index == position:
-                    return block
-
-        elif "pattern" in anchor_def:
-            pattern = re.compile(anchor_def["pattern"])
-            for block in context:
-                if isinstance(block, ParagraphBlock):
-                    text = block.paragraph.text or ""
-                    if pattern.match(text):
-                        return block
-
-        return None
-
 
 class RelativePositionInRangeMatcher(Matcher):
     """相对于父区域的位置匹配器
@@ -237,6 +268,8 @@ class RelativePositionInRangeMatcher(Matcher):
         position: -2      # 范围内的倒数第二个
     """
 
+    unique = True
+
     def __init__(self, position: int, parent_range: List[Block]):
         """
         Args:
@@ -249,21 +282,48 @@ class RelativePositionInRangeMatcher(Matcher):
         self.position = position
         self.parent_range = parent_range
 
-    def match(self, block: Block, context: List[Block]) -> bool:
-        # 检查 block 是否在 parent_range 中
-        if block not in self.parent_range:
-            return False
-
+        # 目标元素只取决于 parent_range，预先确定，
+        # 避免每次 match 都对 parent_range 做线性查找和逐字段比较
         # 数字索引（相对于 parent_range）
         # 支持负数索引：-1 表示最后一个，-2 表示倒数第二个
-        if self.position < 0:
-            target_idx = len(self.parent_range) + self.position
+        if position < 0:
+            target_idx = len(parent_range) + position
+        else:
+            target_idx = position
+
+        if 0 <= target_idx < len(parent_range):
+            self._target: Optional[Block] = parent_range[target_idx]
         else:
-            target_idx = self.position
+            self._target = None
+
+    def match(self, block: Block, context: List[Block]) -> bool:
+        return self._target is not None and block is self._target
+
+
+class SubRangeMatcher(Matcher):
+    """子范围匹配器
+
+    匹配属于给定子范围的元素（用于 children 中的区间表达式）。
+
+    Examples:
+        position: {type: relative, index: "(author-list, corresponding-author)"}
+    """
+
+    def __init__(self, sub_range: List[Block]):
+        self.sub_range = sub_range
+        self.sub_range_set = set(sub_range)
+
+    def match(self, block: Block, context: List[Block]) -> bool:
+        return block in self.sub_range_set
 
-        if 0 <= target_idx < len(self.parent_range):
-            return block == self.parent_range[target_idx]
 
+class NeverMatcher(Matcher):
+    """永不匹配的匹配器
+
+    区间表达式引用的锚点不存在时使用。
+    """
+
+    def match(self, block: Block, context: List[Block]) -> bool:
         return False
 
 
@@ -303,6 +363,11 @@ class Classifier:
         self.rules = rules
         # 构建规则索引：class_name -> rule
         self.rule_index = {rule["class"]: rule for rule in rules}
+        # 依赖索引：class_name -> 依赖的 class 列表（循环检测和分类时共用，只解析一次）
+        self.dependencies = {
+            class_name: self._extract_dependencies(rule)
+            for class_name, rule in self.rule_index.items()
+        }
         # 记录已处理的规则（避免重复处理）
         self.processed = set()
         
@@ -345,11 +410,8 @@ class Classifier:
         if class_name in self.processed:
             return
 
-        # 提取依赖的 class
-        dependencies = self._extract_dependencies(rule)
-
         # 递归处理依赖
-        for dep_class in dependencies:
+        for dep_class in self.dependencies[class_name]:
             if dep_class in self.rule_index and dep_class not in self.processed:
                 dep_rule = self.rule_index[dep_class]
                 self._process_rule_with_dependencies(dep_rule, blocks)
@@ -392,24 +454,11 @@ class Classifier:
                     if "class" in position_config:
                         dependencies.append(position_config["class"])
 
-        # 旧语法：after/before 中的 class 引用（向后兼容）
-        if "after" in match_config and isinstance(match_config["after"], dict):
-            if "class" in match_config["after"]:
-                dependencies.append(match_config["after"]["class"])
-
-        if "before" in match_config and isinstance(match_config["before"], dict):
-            if "class" in match_config["before"]:
-                dependencies.append(match_config["before"]["class"])
-
-        # 旧语法：range 中的 class 引用（向后兼容）
-        if "range" in match_config:
-            range_config = match_config["range"]
-            if "after" in range_config and isinstance(range_config["after"], dict):
-                if "class" in range_config["after"]:
-                    dependencies.append(range_config["after"]["class"])
-            if "before" in range_config and isinstance(range_config["before"], dict):
-                if "class" in range_config["before"]:
-                    dependencies.append(range_config["before"]["class"])
+        # 旧语法：after/before 及 range 中的 class 引用（向后兼容）
+        for path in (("after",), ("before",), ("range", "after"), ("range", "before")):
+            dep_class = _dig(match_config, *path, "class")
+            if dep_class is not None:
+                dependencies.append(dep_class)
 
         return dependencies
 
@@ -449,11 +498,8 @@ class Classifier:
             path.append(class_name)
             
             # 获取依赖
-            if class_name in self.rule_index:
-                rule = self.rule_index[class_name]
-                dependencies = self._extract_dependencies(rule)
-                
-                for dep_class in dependencies:
+            if class_name in self.dependencies:
+                for dep_class in self.dependencies[class_name]:
                     # 忽略未定义的依赖（可能是外部引用）
                     if dep_class not in state:
                         continue
@@ -492,11 +538,14 @@ class Classifier:
         matchers = self._build_matchers(match_config)
 
         # 查找匹配的块
+        unique = any(matcher.unique for matcher in matchers)
         matched_blocks = []
         for block in blocks:
             if all(matcher.match(block, blocks) for matcher in matchers):
                 block.add_class(class_name)
                 matched_blocks.append(block)
+                if unique:
+                    break
 
         # 如果有 children 配置，处理子元素
         if "children" in rule and matched_blocks:
@@ -515,25 +564,34 @@ class Classifier:
             parent_blocks: 父区域匹配到的块列表
             all_blocks: 所有块列表
         """
-        # 对每个父区域，应用子规则
-        for parent_block in parent_blocks:
-            # 确定父区域的范围
-            # 如果父区域只有一个块，范围就是这个块
-            # 如果有多个块，需要根据实际情况确定范围
-
-            # 这里简化处理：假设父区域是连续的块
-            # 找到父区域的起始和结束索引
-            parent_indices = [b.index for b in parent_blocks]
-            start_idx = min(parent_indices)
-            end_idx = max(parent_indices)
-
-            # 获取父区域范围内的所有块
-            parent_range = [b for b in all_blocks if start_idx <= b.index <= end_idx]
-
+        # 确定父区域的范围
+        # 如果父区域只有一个块，范围就是这个块
+        # 如果有多个块，需要根据实际情况确定范围
+
+        # 这里简化处理：假设父区域是连续的块
+        # 找到父区域的起始和结束索引（与具体父块无关，只计算一次）
+        # parent_blocks 按文档顺序收集，首尾即最小/最大索引，无需建列表再各扫描一遍
+        start_idx = parent_blocks[0].index
+        end_idx = parent_blocks[-1].index
+
+        # 获取父区域范围内的所有块
+        parent_range = [b for b in all_blocks if start_idx <= b.index <= end_idx]
+
+        # 对每个父块各应用一轮子规则（后面的轮次可以用到前面轮次新增的 class，
+        # 例如区间表达式引用了排在后面的兄弟子规则）。
+        # 各轮只会添加 class，一轮没有新增 class 时之后的轮次结果必然相同，可提前结束。
+        # 上一轮结束时的 class 总数即下一轮开始时的总数，每轮只需统计一次
+        class_count = sum(len(b.classes) for b in parent_range)
+        for _ in parent_blocks:
             # 应用每条子规则
             for child_rule in children_rules:
                 self._apply_child_rule(child_rule, parent_range, all_blocks)
 
+            new_count = sum(len(b.classes) for b in parent_range)
+            if new_count == class_count:
+                break
+            class_count = new_count
+
     def _apply_child_rule(
         self, rule: Dict[str, Any], parent_range: List[Block], all_blocks: List[Block]
     ) -> None:
@@ -551,9 +609,12 @@ class Classifier:
         matchers = self._build_matchers_for_children(match_config, parent_range)
 
         # 在父区域范围内查找匹配的块
+        unique = any(matcher.unique for matcher in matchers)
         for block in parent_range:
             if all(matcher.match(block, all_blocks) for matcher in matchers):
                 block.add_class(class_name)
+                if unique:
+                    break
 
     def _build_matchers_for_children(
         self, config: Dict[str, Any], parent_range: List[Block]
@@ -583,50 +644,35 @@ class Classifier:
                     position_index = position_config["index"]
                     
                     # 检查是否是区间表达式
-                    if isinstance(position_index, str) and any(c in position_index for c in '()[]'):
+                    if isinstance(position_index, str) and not _RANGE_BRACKETS.isdisjoint(position_index):
                         # 区间表达式：在 parent_range 中查找引用的 class
                         # 例如：(author-list, corresponding-author)
-                        import re
-                        pattern = r'[\[\(]\s*(\w+(?:-\w+)*)\s*,\s*(\w+(?:-\w+)*)\s*[\]\)]'
-                        match = re.match(pattern, position_index.strip())
+                        match = _RANGE_EXPR_RE.match(position_index.strip())
                         
                         if match:
                             class1, class2 = match.groups()
                             
-                            # 在 parent_range 中查找这两个 class 的块
-                            anchor1 = None
-                            anchor2 = None
+                            # 在 parent_range 中查找这两个 class 的块，
+                            # 同一遍扫描中直接记录位置，无需再用 index() 回查
+                            start_idx = None
+                            end_idx = None
                             
-                            for block in parent_range:
+                            for pos, block in enumerate(parent_range):
                                 if block.has_class(class1):
-                                    anchor1 = block
+                                    start_idx = pos
                                 if block.has_class(class2):
-                                    anchor2 = block
+                                    end_idx = pos
                             
                             # 如果找到了两个锚点，创建范围匹配器
-                            if anchor1 and anchor2:
-                                # 创建一个子范围：anchor1 和 anchor2 之间的块
-                                start_idx = parent_range.index(anchor1)
-                                end_idx = parent_range.index(anchor2)
-                                
+                            if start_idx is not None and end_idx is not None:
+                                # 创建一个子范围：两个锚点之间的块
                                 # 开区间：不包含锚点本身
                                 sub_range = parent_range[start_idx + 1:end_idx]
                                 
-                                # 使用一个简单的匹配器：检查 block 是否在 sub_range 中
-                                class SubRangeMatcher(Matcher):
-                                    def __init__(self, sub_range):
-                                        self.sub_range = sub_range
-                                    
-                                    def match(self, block, context):
-                                        return block in self.sub_range
-                                
+                                # 检查 block 是否在 sub_range 中
                                 matchers.append(SubRangeMatcher(sub_range))
                             else:
                                 # 锚点未找到，这个匹配器永远不会匹配
-                                class NeverMatcher(Matcher):
-                                    def match(self, block, context):
-                                        return False
-                                
                                 matchers.append(NeverMatcher())
                         else:
                             # 区间表达式格式错误
@@ -708,10 +754,6 @@ class Classifier:
             else:
                 matchers.append(PositionMatcher(position_config))
 
-        # 内容模式匹配
-        if "pattern" in config:
-            matchers.append(PatternMatcher(config["pattern"]))
-
         # 旧语法：after/before（向后兼容）
         if "after" in config:
             offset = config.get("offset", 0)
@@ -726,6 +768,11 @@ class Classifier:
             range_config = config["range"]
             matchers.append(RangeMatcher(range_config["after"], range_config["before"]))
 
+        # 内容模式匹配
+        # 放在最后：需要拼接段落文本，开销最大，all() 会在前面的廉价匹配器失败时短路
+        if "pattern" in config:
+            matchers.append(PatternMatcher(config["pattern"]))
+
         return matchers
     
     def _parse_range_expression(self, expr: str) -> List[Matcher]:
@@ -4,7 +4,7 @@ from typing import List
 
 from docx import Document
 
-from .model import Issue
+from .model import Block, Issue
 from .walker import Walker
 
 
@@ -12,6 +12,24 @@ class DocxLint:
     def __init__(self, config: dict):
         self.config = config
 
+    def classify(self, docx_path: str) -> List[Block]:
+        """读取文档并完成语义标注（Classifier）
+
+        run() 与查询工具共用这一步，避免各自维护一份 Document/Walker/Classifier 流程。
+        配置中没有 classifiers 时返回未标注的元素列表。
+        """
+        from .classifier import Classifier
+
+        doc = Document(docx_path)
+        blocks = list(Walker().iter_blocks(doc))
+
+        document_config = self.config.get('document', {})
+        if 'classifiers' in document_config:
+            classifier = Classifier(document_config['classifiers'])
+            blocks = classifier.classify(blocks)
+
+        return blocks
+
     def run(self, docx_path: str) -> List[Issue]:
         """运行文档检查
         
@@ -19,25 +37,18 @@ class DocxLint:
         1. 语义标注（Classifier）：给文档元素添加 class
         2. 样式检查（StyleChecker）：检查每个 class 的样式是否符合要求
         """
-        from .classifier import Classifier
         from .style_checker import StyleChecker
         
-        doc = Document(docx_path)
-        blocks = list(Walker().iter_blocks(doc))
-        
         document_config = self.config.get('document', {})
         
+        # 没有配置样式时不会产生任何问题，无需打开和分析文档
+        if not document_config.get('styles'):
+            return []
+        
         # 阶段 1: 语义标注（给元素添加 class）
-        if 'classifiers' in document_config:
-            classifier = Classifier(document_config['classifiers'])
-            blocks = classifier.classify(blocks)
+        blocks = self.classify(docx_path)
         
         # 阶段 2: 样式检查
-        issues = []
-        if 'styles' in document_config:
-            defaults = document_config.get('defaults')
-            style_checker = StyleChecker(document_config['styles'], defaults)
-            issues = style_checker.check(blocks)
-        
-        return issues
-
+        defaults = document_config.get('defaults')
+        style_checker = StyleChecker(document_config['styles'], defaults)
+        return style_checker.check(blocks)
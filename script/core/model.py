@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any, List, Optional, Union
 
 from docx.table import Table
@@ -30,10 +31,13 @@ class Issue:
     evidence: Optional[dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(eq=False)
 class ParagraphBlock:
     """段落元素
     
+    按身份比较和哈希：两个元素相等当且仅当是同一个对象，
+    可直接用作 dict/set 的键，比较时不会逐字段比较 python-docx 对象。
+    
     Attributes:
         index: 元素在文档中的索引位置
         paragraph: python-docx 的 Paragraph 对象
@@ -43,6 +47,15 @@ class ParagraphBlock:
     paragraph: Paragraph
     classes: List[str] = field(default_factory=list)
     
+    @cached_property
+    def text(self) -> str:
+        """段落文本
+        
+        Paragraph.text 每次访问都会遍历所有 run 重新拼接；
+        检查期间文档内容不变，首次读取后缓存在元素上复用。
+        """
+        return self.paragraph.text or ""
+    
     def add_class(self, class_name: str) -> None:
         """添加 class
         
@@ -72,10 +85,12 @@ class ParagraphBlock:
         return self.classes.copy()
 
 
-@dataclass
+@dataclass(eq=False)
 class TableBlock:
     """表格元素
     
+    与 ParagraphBlock 一样按身份比较和哈希。
+    
     Attributes:
         index: 元素在文档中的索引位置
         table: python-docx 的 Table 对象
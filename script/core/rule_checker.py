@@ -8,18 +8,118 @@ RuleChecker - 内容规则检查器
 - 跨元素数量比较（count_equals）
 """
 
+import operator
 import re
-from typing import List, Dict, Any, Optional, Union
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union, Callable, Tuple
 from script.core.model import ParagraphBlock, TableBlock, Issue, Location, Severity
 from script.core.selector import Selector
 
 # 类型别名
 Block = Union[ParagraphBlock, TableBlock]
 
+# 数量表达式支持的比较运算符（'>=' 等双字符运算符须排在 '>' 之前）
+_COUNT_OPERATORS = (
+    ('>=', operator.ge),
+    ('<=', operator.le),
+    ('>', operator.gt),
+    ('<', operator.lt),
+    ('==', operator.eq),
+    ('!=', operator.ne),
+)
+
+
+@lru_cache(maxsize=None)
+def _parse_count_expression(expr: str) -> Optional[Tuple[Callable[[int, int], bool], int]]:
+    """解析数量表达式为 (比较函数, 目标值)，结果按表达式缓存
+
+    Args:
+        expr: 表达式（如 ">= 2", "== 3", "5"）
+
+    Returns:
+        (比较函数, 目标值)；无运算符且不是整数时返回 None
+    """
+    expr = expr.strip()
+    for prefix, compare in _COUNT_OPERATORS:
+        if expr.startswith(prefix):
+            return compare, int(expr[len(prefix):].strip())
+
+    # 默认为相等比较
+    try:
+        return operator.eq, int(expr)
+    except ValueError:
+        return None
+
+
+# 规则配置中 severity 的别名（配置里普遍写作 'warning'）
+_SEVERITY_ALIASES = {
+    'warning': Severity.WARN,
+}
+
+
+def _parse_severity(value: str) -> Severity:
+    """将规则配置中的 severity 字符串解析为 Severity
+
+    Args:
+        value: severity 字符串（不区分大小写，如 'error', 'warning', 'info'）
+
+    Returns:
+        Severity 枚举值
+
+    Raises:
+        ValueError: 无法识别的 severity
+    """
+    value = value.lower()
+    return _SEVERITY_ALIASES.get(value) or Severity(value)
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """预处理后的规则
+
+    规则配置在初始化时解析一次（包括 severity），避免每次检查或生成 Issue 时
+    都重复查询配置字典、重新构造枚举值。
+    """
+    id: str
+    selector: Optional[str]
+    condition: Optional[Dict[str, Any]]
+    check: Dict[str, Any]
+    severity: Severity
+    message: str
+
+    @classmethod
+    def from_config(cls, rule: Dict[str, Any]) -> 'CompiledRule':
+        """从规则配置构建
+
+        Args:
+            rule: 规则配置
+
+        Returns:
+            预处理后的规则
+        """
+        rule_id = rule.get('id', 'unknown')
+        return cls(
+            id=rule_id,
+            selector=rule.get('selector'),
+            condition=rule.get('condition'),
+            check=rule.get('check', {}),
+            severity=_parse_severity(rule.get('severity', 'warning')),
+            message=rule.get('message', f'Rule {rule_id} failed'),
+        )
+
 
 class RuleChecker:
     """内容规则检查器"""
     
+    # 检查类型 -> 处理方法名（规则同时配置多种检查时，只执行排在最前的一种）
+    CHECK_HANDLERS = (
+        ('pattern', '_check_pattern'),
+        ('exists', '_check_exists'),
+        ('count', '_check_count'),
+        ('count_equals', '_check_count_equals'),
+    )
+    
     def __init__(self, rules: List[Dict[str, Any]], blocks: List[Block]):
         """
         初始化规则检查器
@@ -29,9 +129,14 @@ class RuleChecker:
             blocks: 已分类的文档块列表
         """
         self.rules = rules
+        self.compiled_rules = [CompiledRule.from_config(rule) for rule in rules]
         self.blocks = blocks
         self.selector = Selector(blocks)
         self.issues: List[Issue] = []
+        # 单次检查内的选择结果缓存：条件、目标、参考选择器常常相同
+        self._selections: Dict[str, List[Block]] = {}
+        # 单次检查内的文本缓存：表格需遍历全部单元格（段落文本已缓存在 block 上）
+        self._texts: Dict[Block, str] = {}
     
     def check(self) -> List[Issue]:
         """
@@ -41,25 +146,27 @@ class RuleChecker:
             问题列表
         """
         self.issues = []
+        self._selections = {}
+        self._texts = {}
         
-        for rule in self.rules:
+        for rule in self.compiled_rules:
             self._check_rule(rule)
         
         return self.issues
     
-    def _check_rule(self, rule: Dict[str, Any]) -> None:
+    def _check_rule(self, rule: CompiledRule) -> None:
         """
         检查单条规则
         
         Args:
-            rule: 规则配置
+            rule: 预处理后的规则
         """
-        rule_id = rule.get('id', 'unknown')
-        selector_str = rule.get('selector')
-        condition = rule.get('condition')
-        check = rule.get('check', {})
-        severity = rule.get('severity', 'warning')
-        message = rule.get('message', f'Rule {rule_id} failed')
+        rule_id = rule.id
+        selector_str = rule.selector
+        condition = rule.condition
+        check = rule.check
+        severity = rule.severity
+        message = rule.message
         
         if not selector_str:
             return
@@ -69,17 +176,32 @@ class RuleChecker:
             return
         
         # 选择目标元素
-        target_blocks = self.selector.select(selector_str)
+        target_blocks = self._select(selector_str)
         
-        # 执行检查
-        if 'pattern' in check:
-            self._check_pattern(target_blocks, check['pattern'], rule_id, severity, message)
-        elif 'exists' in check:
-            self._check_exists(target_blocks, check['exists'], rule_id, severity, message)
-        elif 'count' in check:
-            self._check_count(target_blocks, check['count'], rule_id, severity, message)
-        elif 'count_equals' in check:
-            self._check_count_equals(target_blocks, check['count_equals'], rule_id, severity, message)
+        # 执行检查：按 CHECK_HANDLERS 的顺序取第一个配置了的检查类型
+        for check_type, handler_name in self.CHECK_HANDLERS:
+            if check_type in check:
+                handler = getattr(self, handler_name)
+                handler(target_blocks, check[check_type], rule_id, severity, message)
+                break
+    
+    def _select(self, selector_str: str) -> List[Block]:
+        """
+        选择元素，同一次检查中相同的选择器只执行一次
+        
+        检查期间 block 的 class 不会变化，结果可以安全复用（调用方不得修改返回的列表）。
+        
+        Args:
+            selector_str: 选择器字符串
+            
+        Returns:
+            匹配的元素列表
+        """
+        blocks = self._selections.get(selector_str)
+        if blocks is None:
+            blocks = self.selector.select(selector_str)
+            self._selections[selector_str] = blocks
+        return blocks
     
     def _check_condition(self, condition: Dict[str, Any]) -> bool:
         """
@@ -93,14 +215,14 @@ class RuleChecker:
         """
         if 'selector' in condition:
             selector_str = condition['selector']
-            blocks = self.selector.select(selector_str)
+            blocks = self._select(selector_str)
             
             # 检查模式
             if 'pattern' in condition:
-                pattern = condition['pattern']
+                regex = re.compile(condition['pattern'])
                 for block in blocks:
                     text = self._get_block_text(block)
-                    if re.search(pattern, text):
+                    if regex.search(text):
                         return True
                 return False
             
@@ -112,7 +234,7 @@ class RuleChecker:
         return True
     
     def _check_pattern(self, blocks: List[Block], pattern: str, 
-                      rule_id: str, severity: str, message: str) -> None:
+                      rule_id: str, severity: Severity, message: str) -> None:
         """
         检查模式匹配
         
@@ -123,9 +245,10 @@ class RuleChecker:
             severity: 严重程度
             message: 错误消息
         """
+        regex = re.compile(pattern)
         for block in blocks:
             text = self._get_block_text(block)
-            if not re.match(pattern, text):
+            if not regex.match(text):
                 location = Location(
                     block_index=block.index,
                     kind='paragraph' if isinstance(block, ParagraphBlock) else 'table',
@@ -133,14 +256,14 @@ class RuleChecker:
                 )
                 self.issues.append(Issue(
                     code=rule_id,
-                    severity=Severity(severity.lower()),
+                    severity=severity,
                     message=message,
                     location=location,
                     evidence={'expected': f"Pattern: {pattern}", 'actual': text}
                 ))
     
     def _check_exists(self, blocks: List[Block], should_exist: bool,
-                     rule_id: str, severity: str, message: str) -> None:
+                     rule_id: str, severity: Severity, message: str) -> None:
         """
         检查存在性
         
@@ -160,14 +283,14 @@ class RuleChecker:
             )
             self.issues.append(Issue(
                 code=rule_id,
-                severity=Severity(severity.lower()),
+                severity=severity,
                 message=message,
                 location=location,
                 evidence={'expected': f"Exists: {should_exist}", 'actual': f"Exists: {exists}"}
             ))
     
     def _check_count(self, blocks: List[Block], count_expr: str,
-                    rule_id: str, severity: str, message: str) -> None:
+                    rule_id: str, severity: Severity, message: str) -> None:
         """
         检查数量
         
@@ -187,14 +310,14 @@ class RuleChecker:
             )
             self.issues.append(Issue(
                 code=rule_id,
-                severity=Severity(severity.lower()),
+                severity=severity,
                 message=message,
                 location=location,
                 evidence={'expected': f"Count {count_expr}", 'actual': f"Count: {actual_count}"}
             ))
     
     def _check_count_equals(self, blocks: List[Block], config: Dict[str, Any],
-                           rule_id: str, severity: str, message: str) -> None:
+                           rule_id: str, severity: Severity, message: str) -> None:
         """
         检查跨元素数量比较
         
@@ -213,7 +336,7 @@ class RuleChecker:
         if not ref_selector:
             return
         
-        ref_blocks = self.selector.select(ref_selector)
+        ref_blocks = self._select(ref_selector)
         
         # 提取参考数量
         extract_pattern = config.get('extract')
@@ -223,21 +346,25 @@ class RuleChecker:
             # 直接使用元素数量
             ref_count = len(ref_blocks)
         elif method == 'max' and extract_pattern:
-            # 从文本中提取数字，取最大值
-            ref_count = 0
-            for block in ref_blocks:
-                text = self._get_block_text(block)
-                numbers = re.findall(extract_pattern, text)
-                if numbers:
-                    max_num = max(int(n) for n in numbers)
-                    ref_count = max(ref_count, max_num)
+            # 从文本中提取数字，取最大值（一次归约，不逐块比较累积；下限为 0）
+            extract_regex = re.compile(extract_pattern)
+            ref_count = max(
+                (
+                    int(n)
+                    for block in ref_blocks
+                    for n in extract_regex.findall(self._get_block_text(block))
+                ),
+                default=0,
+            )
+            ref_count = max(ref_count, 0)
         elif method == 'sum' and extract_pattern:
-            # 从文本中提取数字，求和
-            ref_count = 0
-            for block in ref_blocks:
-                text = self._get_block_text(block)
-                numbers = re.findall(extract_pattern, text)
-                ref_count += len(numbers)
+            # 统计提取到的数字个数（逐个计数，不为每个块构建匹配列表）
+            extract_regex = re.compile(extract_pattern)
+            ref_count = sum(
+                1
+                for block in ref_blocks
+                for _ in extract_regex.finditer(self._get_block_text(block))
+            )
         else:
             return
         
@@ -250,7 +377,7 @@ class RuleChecker:
             )
             self.issues.append(Issue(
                 code=rule_id,
-                severity=Severity(severity.lower()),
+                severity=severity,
                 message=message,
                 location=location,
                 evidence={'expected': f"Count: {ref_count}", 'actual': f"Count: {target_count}"}
@@ -267,38 +394,15 @@ class RuleChecker:
         Returns:
             表达式是否成立
         """
-        expr = expr.strip()
-        
-        # 解析表达式
-        if expr.startswith('>='):
-            target = int(expr[2:].strip())
-            return count >= target
-        elif expr.startswith('<='):
-            target = int(expr[2:].strip())
-            return count <= target
-        elif expr.startswith('>'):
-            target = int(expr[1:].strip())
-            return count > target
-        elif expr.startswith('<'):
-            target = int(expr[1:].strip())
-            return count < target
-        elif expr.startswith('=='):
-            target = int(expr[2:].strip())
-            return count == target
-        elif expr.startswith('!='):
-            target = int(expr[2:].strip())
-            return count != target
-        else:
-            # 默认为相等比较
-            try:
-                target = int(expr)
-                return count == target
-            except ValueError:
-                return False
+        parsed = _parse_count_expression(expr)
+        if parsed is None:
+            return False
+        compare, target = parsed
+        return compare(count, target)
     
     def _get_block_text(self, block: Block) -> str:
         """
-        获取块的文本内容
+        获取块的文本内容，同一次检查中每个块只提取一次
         
         Args:
             block: 文档块
@@ -306,13 +410,28 @@ class RuleChecker:
         Returns:
             文本内容
         """
-        if hasattr(block, 'paragraph') and block.paragraph:
-            return block.paragraph.text
+        text = self._texts.get(block)
+        if text is None:
+            text = self._extract_block_text(block)
+            self._texts[block] = text
+        return text
+    
+    def _extract_block_text(self, block: Block) -> str:
+        """
+        从块中提取文本内容
+        
+        Args:
+            block: 文档块
+            
+        Returns:
+            文本内容
+        """
+        if isinstance(block, ParagraphBlock):
+            # 段落文本缓存在 block 上，与分类、样式检查阶段共用
+            return block.text
         elif hasattr(block, 'table') and block.table:
-            # 对于表格，返回所有单元格的文本
-            texts = []
-            for row in block.table.rows:
-                for cell in row.cells:
-                    texts.append(cell.text)
-            return ' '.join(texts)
+            # 对于表格，返回所有单元格的文本（生成器直接交给 join，不另建中间列表）
+            return ' '.join(
+                cell.text for row in block.table.rows for cell in row.cells
+            )
         return ''
@@ -5,12 +5,13 @@
 """
 
 import re
-from typing import List, Optional, Callable
+from functools import lru_cache
+from typing import Iterator, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 from script.core.model import Block
 
 
-@dataclass
+@dataclass(frozen=True)
 class SelectorToken:
     """选择器词法单元"""
     type: str  # class, child, descendant, adjacent, pseudo, attr
@@ -61,6 +62,16 @@ class SelectorParser:
         return self.tokens
 
 
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> Tuple[SelectorToken, ...]:
+    """解析并缓存选择器
+
+    同一选择器字符串往往被反复查询（规则检查、命令行多次调用），
+    解析结果只依赖字符串本身，缓存不可变的 token 元组即可复用。
+    """
+    return tuple(SelectorParser(selector).parse())
+
+
 class Selector:
     """文档元素选择器"""
     
@@ -91,15 +102,19 @@ class Selector:
         Returns:
             匹配的元素列表
         """
-        # 解析选择器
-        parser = SelectorParser(selector)
-        tokens = parser.parse()
+        # 解析选择器（带缓存）
+        tokens = _compile_selector(selector)
         
         if not tokens:
             return []
         
         # 从所有 blocks 开始匹配
-        results = self.blocks[:]
+        # 各过滤步骤都会生成新列表，无需预先复制；仅在未经过滤时返回副本
+        results = self.blocks
+        
+        # 连续的类条件先攒起来，在需要用到结果时一次遍历完成过滤，
+        # 避免每个类选择器都扫描一遍结果列表
+        pending_classes: List[str] = []
         
         # 逐个处理 token
         i = 0
@@ -108,11 +123,7 @@ class Selector:
             
             if token.type == 'class':
                 # 类选择器：筛选具有指定 class 的元素
-                results = [b for b in results if token.value in b.classes]
-            
-            elif token.type == 'pseudo':
-                # 伪类选择器
-                results = self._apply_pseudo(results, token.value)
+                pending_classes.append(token.value)
             
             elif token.type == 'child':
                 # 子选择器：下一个 token 必须是直接子元素
@@ -121,35 +132,82 @@ class Selector:
                 if i < len(tokens):
                     next_token = tokens[i]
                     if next_token.type == 'class':
-                        results = [b for b in results if next_token.value in b.classes]
+                        pending_classes.append(next_token.value)
             
             elif token.type == 'descendant':
                 # 后代选择器：下一个 token 可以是任意后代
                 # 简化实现：与子选择器相同
                 pass
             
-            elif token.type == 'adjacent':
-                # 相邻兄弟选择器：下一个 token 必须是紧邻的兄弟
-                i += 1
-                if i < len(tokens):
-                    next_token = tokens[i]
-                    if next_token.type == 'class':
-                        # 找到每个结果的下一个兄弟
-                        adjacent_results = []
-                        for block in results:
-                            next_block = self._get_next_sibling(block)
-                            if next_block and next_token.value in next_block.classes:
-                                adjacent_results.append(next_block)
-                        results = adjacent_results
-            
-            elif token.type == 'attr':
-                # 属性选择器
-                results = self._apply_attr_filter(results, token.value)
+            else:
+                # 以下过滤依赖当前结果，先应用累积的类条件
+                results = self._filter_classes(results, pending_classes)
+                pending_classes = []
+                
+                if token.type == 'pseudo':
+                    # 伪类选择器
+                    results = self._apply_pseudo(results, token.value)
+                
+                elif token.type == 'adjacent':
+                    # 相邻兄弟选择器：下一个 token 必须是紧邻的兄弟
+                    i += 1
+                    if i < len(tokens):
+                        next_token = tokens[i]
+                        if next_token.type == 'class':
+                            # 找到每个结果的下一个兄弟
+                            adjacent_results = []
+                            for block in results:
+                                next_block = self._get_next_sibling(block)
+                                if next_block and next_token.value in next_block.classes:
+                                    adjacent_results.append(next_block)
+                            results = adjacent_results
+                
+                elif token.type == 'sibling':
+                    # 通用兄弟选择器：下一个 token 可以是之后任意位置的兄弟
+                    # 结果按文档顺序排列，只需从第一个结果之后开始查找
+                    i += 1
+                    if i < len(tokens):
+                        next_token = tokens[i]
+                        if next_token.type == 'class':
+                            start = self._position_of(results[0]) if results else None
+                            if start is None:
+                                results = []
+                            else:
+                                results = [
+                                    b for b in self.blocks[start + 1:]
+                                    if next_token.value in b.classes
+                                ]
+                
+                elif token.type == 'attr':
+                    # 属性选择器
+                    results = self._apply_attr_filter(results, token.value)
             
             i += 1
         
+        results = self._filter_classes(results, pending_classes)
+        
+        if results is self.blocks:
+            return list(results)
         return results
     
+    @staticmethod
+    def _filter_classes(blocks: List[Block], class_names: List[str]) -> List[Block]:
+        """一次遍历筛选出同时具有所有指定 class 的元素
+        
+        Args:
+            blocks: 待过滤的元素列表
+            class_names: 要求具有的 class 列表（为空时原样返回）
+            
+        Returns:
+            过滤后的元素列表
+        """
+        if not class_names:
+            return blocks
+        if len(class_names) == 1:
+            class_name = class_names[0]
+            return [b for b in blocks if class_name in b.classes]
+        return [b for b in blocks if all(c in b.classes for c in class_names)]
+    
     def select_one(self, selector: str) -> Optional[Block]:
         """选择第一个匹配的元素
         
@@ -159,6 +217,11 @@ class Selector:
         Returns:
             第一个匹配的元素，如果没有则返回 None
         """
+        class_names = self._simple_class_names(selector)
+        if class_names is not None:
+            # 纯类选择器：找到第一个匹配即停止，不构建完整结果列表
+            return next(self._iter_with_classes(class_names), None)
+        
         results = self.select(selector)
         return results[0] if results else None
     
@@ -171,7 +234,40 @@ class Selector:
         Returns:
             是否存在匹配的元素
         """
-        return len(self.select(selector)) > 0
+        return self.select_one(selector) is not None
+    
+    @staticmethod
+    def _simple_class_names(selector: str) -> Optional[List[str]]:
+        """判断选择器是否只由类条件组成（可带结尾的 :first）
+        
+        这类选择器的第一个匹配元素就是文档中第一个同时具有这些 class 的元素，
+        可以逐个检查、命中即停。
+        
+        Args:
+            selector: CSS 风格的选择器字符串
+            
+        Returns:
+            类名列表；选择器包含其他条件（或为空）时返回 None
+        """
+        tokens = _compile_selector(selector)
+        if tokens and tokens[-1] == SelectorToken('pseudo', 'first'):
+            tokens = tokens[:-1]
+        if not tokens or any(token.type != 'class' for token in tokens):
+            return None
+        return [token.value for token in tokens]
+    
+    def _iter_with_classes(self, class_names: List[str]) -> Iterator[Block]:
+        """按文档顺序逐个产出同时具有所有指定 class 的元素
+        
+        Args:
+            class_names: 要求具有的 class 列表
+            
+        Yields:
+            匹配的元素
+        """
+        for block in self.blocks:
+            if all(c in block.classes for c in class_names):
+                yield block
     
     def count(self, selector: str) -> int:
         """统计匹配的元素数量
@@ -263,12 +359,9 @@ class Selector:
         Returns:
             下一个兄弟元素，如果没有则返回 None
         """
-        try:
-            current_index = self.blocks.index(block)
-            if current_index + 1 < len(self.blocks):
-                return self.blocks[current_index + 1]
-        except ValueError:
-            pass
+        current_index = self._position_of(block)
+        if current_index is not None and current_index + 1 < len(self.blocks):
+            return self.blocks[current_index + 1]
         return None
     
     def _get_prev_sibling(self, block: Block) -> Optional[Block]:
@@ -280,10 +373,27 @@ class Selector:
         Returns:
             前一个兄弟元素，如果没有则返回 None
         """
-        try:
-            current_index = self.blocks.index(block)
-            if current_index > 0:
-                return self.blocks[current_index - 1]
-        except ValueError:
-            pass
+        current_index = self._position_of(block)
+        if current_index is not None and current_index > 0:
+            return self.blocks[current_index - 1]
+        return None
+    
+    def _position_of(self, block: Block) -> Optional[int]:
+        """获取元素在 self.blocks 中的位置
+        
+        _build_relationships 已把位置写入 block.index，先直接校验；
+        block.index 可能已被另一个共享这些元素的 Selector 改写，校验失败时按身份线性查找。
+        
+        Args:
+            block: 当前元素
+            
+        Returns:
+            元素位置，如果不属于本选择器则返回 None
+        """
+        index = block.index
+        if 0 <= index < len(self.blocks) and self.blocks[index] is block:
+            return index
+        for i, b in enumerate(self.blocks):
+            if b is block:
+                return i
         return None
@@ -5,13 +5,21 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+from docx.oxml.text.font import CT_Fonts
+from docx.text.run import Run
 
 from script.core.model import Block, Issue, Location, ParagraphBlock, Severity
 from script.utils.unit_converter import UnitConverter
 
+# run 元素及 w:rFonts 上的字体属性（Clark 记法，预先计算）
+_W_R = qn('w:r')
+_W_EAST_ASIA = qn('w:eastAsia')
+_W_ASCII = qn('w:ascii')
+
 
 class StyleChecker:
     """样式检查器
@@ -54,6 +62,22 @@ class StyleChecker:
         '分散对齐': WD_ALIGN_PARAGRAPH.DISTRIBUTE,
         'DISTRIBUTE': WD_ALIGN_PARAGRAPH.DISTRIBUTE,
     }
+    
+    # 对齐方式枚举 -> 显示名称（ALIGNMENT_MAP 的反向映射，用于报告实际对齐方式）
+    # 同一枚举有多个名称时取最后注册的名称
+    ALIGNMENT_NAMES = {v: k for k, v in ALIGNMENT_MAP.items()}
+
+    # 字体名称检查：(font 配置键, rFonts 属性, Issue 代码前缀, 提示文字)
+    FONT_NAME_CHECKS = (
+        ('name_eastasia', _W_EAST_ASIA, 'STYLE-FONT-NAME', '中文字体'),
+        ('name_ascii', _W_ASCII, 'STYLE-FONT-NAME-ASCII', '西文字体'),
+    )
+
+    # 段前/段后间距检查：(paragraph_format 属性名, Issue 代码片段, 提示文字)
+    SPACING_CHECKS = (
+        ('space_before', 'SPACE-BEFORE', '段前间距'),
+        ('space_after', 'SPACE-AFTER', '段后间距'),
+    )
 
     def __init__(
         self,
@@ -67,6 +91,13 @@ class StyleChecker:
         """
         self.styles = styles
         self.defaults = defaults or {}
+        # 按 class 名（去掉前导 .）索引的样式定义，检查时免去逐次拼接选择器字符串；
+        # 空的样式定义不产生任何检查，直接略去
+        self._class_styles = {
+            selector[1:]: style_def
+            for selector, style_def in styles.items()
+            if selector.startswith('.') and style_def
+        }
     
     @classmethod
     def register_alignment_alias(cls, alias: str, alignment: WD_ALIGN_PARAGRAPH):
@@ -80,6 +111,8 @@ class StyleChecker:
             >>> StyleChecker.register_alignment_alias("中央揃え", WD_ALIGN_PARAGRAPH.CENTER)
         """
         cls.ALIGNMENT_MAP[alias] = alignment
+        # 整体重建反向映射：别名改指其他枚举值时，旧枚举值不能再显示为该别名
+        cls.ALIGNMENT_NAMES = {v: k for k, v in cls.ALIGNMENT_MAP.items()}
 
     def check(self, blocks: List[Block]) -> List[Issue]:
         """检查所有元素的样式
@@ -90,30 +123,71 @@ class StyleChecker:
         Returns:
             Issue 列表
         """
-        issues = []
+        # 没有任何需要检查的样式时，无需遍历元素
+        if not self._class_styles:
+            return []
+
+        issues: List[Issue] = []
         for block in blocks:
             issues.extend(self._check_block(block))
         return issues
 
-    def _check_block(self, block: Block) -> List[Issue]:
+    @staticmethod
+    def _hint(block: ParagraphBlock) -> str:
+        """Issue 定位提示：段落文本的前 50 个字符
+
+        文本取自 block.text，分类阶段已读取过的段落不会重新拼接 run。
+        """
+        return block.text[:50]
+
+    @staticmethod
+    def _rfonts(run: Run) -> Optional[CT_Fonts]:
+        """获取 run 的 w:rPr/w:rFonts 元素
+
+        同一个 run 的各项字体名称检查共用一次查找，之后按限定名直接取属性。
+
+        Args:
+            run: python-docx 的 Run 对象
+
+        Returns:
+            rFonts 元素，未设置时返回 None
+        """
+        rpr = run._r.rPr
+        return rpr.rFonts if rpr is not None else None
+
+    def _check_block(self, block: Block) -> Iterator[Issue]:
         """检查单个元素的样式"""
-        issues = []
+        # 段落的第一个 run 与 class 无关：所有 class 的字体检查共用一次查找，
+        # 在遇到第一个带 font 的样式时才查找（不再先收集样式、再扫描一遍）
+        run = None
+        run_resolved = False
         
         # 检查每个 class 对应的样式
         for class_name in block.classes:
-            style_def = self.styles.get(f'.{class_name}')
-            if style_def:
-                issues.extend(
-                    self._check_style(block, style_def, class_name)
-                )
-        
-        return issues
+            style_def = self._class_styles.get(class_name)
+            if style_def is None:
+                continue
+            if not run_resolved and 'font' in style_def and isinstance(block, ParagraphBlock):
+                run = self._first_run(block.paragraph)
+                run_resolved = True
+            yield from self._check_style(block, style_def, class_name, run)
+
+    @staticmethod
+    def _first_run(paragraph) -> Optional[Run]:
+        """获取段落中的第一个 run，没有时返回 None
+
+        只定位第一个 w:r，不为整段的所有 run 构造 Run 对象
+        （paragraph.runs 每次访问都会重建完整列表）。
+        """
+        r = paragraph._p.find(_W_R)
+        return Run(r, paragraph) if r is not None else None
 
     def _check_style(
         self,
         block: Block,
         style_def: Dict[str, Any],
-        class_name: str
+        class_name: str,
+        run: Optional[Run]
     ) -> List[Issue]:
         """根据样式定义检查元素"""
         issues = []
@@ -125,7 +199,7 @@ class StyleChecker:
         # 检查字体
         if 'font' in style_def:
             issues.extend(
-                self._check_font(block, style_def['font'], class_name)
+                self._check_font(block, style_def['font'], class_name, run)
             )
         
         # 检查段落格式
@@ -140,80 +214,41 @@ class StyleChecker:
         self,
         block: ParagraphBlock,
         font_def: Dict[str, Any],
-        class_name: str
+        class_name: str,
+        run: Optional[Run]
     ) -> List[Issue]:
-        """检查字体样式"""
+        """检查字体样式
+
+        Args:
+            run: 段落中的第一个 run（由 _check_block 统一获取），没有 run 时为 None
+        """
         issues = []
-        paragraph = block.paragraph
         
         # 检查段落中的第一个 run（如果有的话）
         # 注意：Word 段落可能有多个 run，这里简化为检查第一个
-        if not paragraph.runs:
+        if run is None:
             return issues
         
-        run = paragraph.runs[0]
         font = run.font
         
-        # 检查中文字体
-        if 'name_eastasia' in font_def:
-            expected_font = font_def['name_eastasia']
-            actual_font = font.name
-            
-            # 尝试获取东亚字体名称
-            try:
-                if hasattr(font.element, 'rPr') and font.element.rPr is not None:
-                    if hasattr(font.element.rPr, 'rFonts') and font.element.rPr.rFonts is not None:
-                        # rFonts 是 XML 元素，使用 get() 方法获取属性
-                        rfonts = font.element.rPr.rFonts
-                        # eastAsia 属性在 XML 中是 {namespace}eastAsia
-                        eastasia = rfonts.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}eastAsia')
-                        if eastasia:
-                            actual_font = eastasia
-            except Exception:
-                pass
+        # 检查中文/西文字体：同一套逻辑，按表驱动
+        rfonts = self._rfonts(run)
+        for key, attr, code, label in self.FONT_NAME_CHECKS:
+            if key not in font_def:
+                continue
+            expected_font = font_def[key]
+            # 优先使用 rFonts 中对应的字体名称
+            actual_font = (rfonts.get(attr) if rfonts is not None else None) or font.name
             
             if actual_font and actual_font != expected_font:
                 issues.append(Issue(
-                    code=f'STYLE-FONT-NAME-{class_name.upper()}',
+                    code=f'{code}-{class_name.upper()}',
                     severity=Severity.ERROR,
-                    message=f'.{class_name} 中文字体应为 {expected_font}，实际为 {actual_font}',
+                    message=f'.{class_name} {label}应为 {expected_font}，实际为 {actual_font}',
                     location=Location(
                         block_index=block.index,
                         kind='paragraph',
-                        hint=paragraph.text[:50] if paragraph.text else ''
-                    ),
-                    evidence={
-                        'expected': expected_font,
-                        'actual': actual_font,
-                        'class': class_name
-                    }
-                ))
-        
-        # 检查西文字体
-        if 'name_ascii' in font_def:
-            expected_font = font_def['name_ascii']
-            actual_font = font.name
-            
-            # 尝试获取 ASCII 字体名称
-            try:
-                if hasattr(font.element, 'rPr') and font.element.rPr is not None:
-                    if hasattr(font.element.rPr, 'rFonts') and font.element.rPr.rFonts is not None:
-                        rfonts = font.element.rPr.rFonts
-                        ascii_font = rfonts.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}ascii')
-                        if ascii_font:
-                            actual_font = ascii_font
-            except Exception:
-                pass
-            
-            if actual_font and actual_font != expected_font:
-                issues.append(Issue(
-                    code=f'STYLE-FONT-NAME-ASCII-{class_name.upper()}',
-                    severity=Severity.ERROR,
-                    message=f'.{class_name} 西文字体应为 {expected_font}，实际为 {actual_font}',
-                    location=Location(
-                        block_index=block.index,
-                        kind='paragraph',
-                        hint=paragraph.text[:50] if paragraph.text else ''
+                        hint=self._hint(block)
                     ),
                     evidence={
                         'expected': expected_font,
@@ -227,16 +262,15 @@ class StyleChecker:
             expected_size = font_def['size']
             # 转换为 half-points
             expected_half_pt = UnitConverter.parse_font_size(expected_size)
+            # font.size 每次访问都要查找并解析 w:sz，只读取一次
+            actual_size = font.size
             
-            if expected_half_pt and font.size:
+            if expected_half_pt and actual_size:
                 # font.size 是 EMU (English Metric Units)
                 # 1 point = 12700 EMU
                 # half-point = 12700 / 2 EMU
-                actual_half_pt = font.size.pt * 2 if hasattr(font.size, 'pt') else None
-                
                 # 转换 EMU 到 half-points
-                if font.size:
-                    actual_half_pt = round(font.size * 2 / 12700)
+                actual_half_pt = round(actual_size * 2 / 12700)
                 
                 if actual_half_pt and abs(actual_half_pt - expected_half_pt) > 0.5:
                     issues.append(Issue(
@@ -246,7 +280,7 @@ class StyleChecker:
                         location=Location(
                             block_index=block.index,
                             kind='paragraph',
-                            hint=paragraph.text[:50] if paragraph.text else ''
+                            hint=self._hint(block)
                         ),
                         evidence={
                             'expected': expected_size,
@@ -269,7 +303,7 @@ class StyleChecker:
                     location=Location(
                         block_index=block.index,
                         kind='paragraph',
-                        hint=paragraph.text[:50] if paragraph.text else ''
+                        hint=self._hint(block)
                     ),
                     evidence={
                         'expected': expected_bold,
@@ -291,7 +325,7 @@ class StyleChecker:
                     location=Location(
                         block_index=block.index,
                         kind='paragraph',
-                        hint=paragraph.text[:50] if paragraph.text else ''
+                        hint=self._hint(block)
                     ),
                     evidence={
                         'expected': expected_italic,
@@ -322,7 +356,7 @@ class StyleChecker:
             expected_align_enum = self.ALIGNMENT_MAP.get(expected_align)
             
             if expected_align_enum is not None and actual_align != expected_align_enum:
-                actual_align_name = {v: k for k, v in self.ALIGNMENT_MAP.items()}.get(actual_align, str(actual_align))
+                actual_align_name = self.ALIGNMENT_NAMES.get(actual_align, str(actual_align))
                 issues.append(Issue(
                     code=f'STYLE-PARA-ALIGN-{class_name.upper()}',
                     severity=Severity.ERROR,
@@ -330,7 +364,7 @@ class StyleChecker:
                     location=Location(
                         block_index=block.index,
                         kind='paragraph',
-                        hint=paragraph.text[:50] if paragraph.text else ''
+                        hint=self._hint(block)
                     ),
                     evidence={
                         'expected': expected_align,
@@ -357,7 +391,7 @@ class StyleChecker:
                     location=Location(
                         block_index=block.index,
                         kind='paragraph',
-                        hint=paragraph.text[:50] if paragraph.text else ''
+                        hint=self._hint(block)
                     ),
                     evidence={
                         'expected': expected_spacing,
@@ -389,7 +423,7 @@ class StyleChecker:
                         location=Location(
                             block_index=block.index,
                             kind='paragraph',
-                            hint=paragraph.text[:50] if paragraph.text else ''
+                            hint=self._hint(block)
                         ),
                         evidence={
                             'expected': expected_indent,
@@ -399,38 +433,12 @@ class StyleChecker:
                         }
                     ))
         
-        # 检查段前间距
-        if 'space_before' in para_def:
-            expected_space = para_def['space_before']
-            actual_space = para_format.space_before
-            
-            expected_twips = UnitConverter.parse_spacing(expected_space, font_size=12)
-            
-            if expected_twips is not None:
-                actual_twips = actual_space if actual_space else 0
-                
-                if abs(actual_twips - expected_twips) > 10:
-                    issues.append(Issue(
-                        code=f'STYLE-PARA-SPACE-BEFORE-{class_name.upper()}',
-                        severity=Severity.WARN,
-                        message=f'.{class_name} 段前间距应为 {expected_space}',
-                        location=Location(
-                            block_index=block.index,
-                            kind='paragraph',
-                            hint=paragraph.text[:50] if paragraph.text else ''
-                        ),
-                        evidence={
-                            'expected': expected_space,
-                            'expected_twips': expected_twips,
-                            'actual_twips': actual_twips,
-                            'class': class_name
-                        }
-                    ))
-        
-        # 检查段后间距
-        if 'space_after' in para_def:
-            expected_space = para_def['space_after']
-            actual_space = para_format.space_after
+        # 检查段前/段后间距
+        for attr, code, label in self.SPACING_CHECKS:
+            if attr not in para_def:
+                continue
+            expected_space = para_def[attr]
+            actual_space = getattr(para_format, attr)
             
             expected_twips = UnitConverter.parse_spacing(expected_space, font_size=12)
             
@@ -439,13 +447,13 @@ class StyleChecker:
                 
                 if abs(actual_twips - expected_twips) > 10:
                     issues.append(Issue(
-                        code=f'STYLE-PARA-SPACE-AFTER-{class_name.upper()}',
+                        code=f'STYLE-PARA-{code}-{class_name.upper()}',
                         severity=Severity.WARN,
-                        message=f'.{class_name} 段后间距应为 {expected_space}',
+                        message=f'.{class_name} {label}应为 {expected_space}',
                         location=Location(
                             block_index=block.index,
                             kind='paragraph',
-                            hint=paragraph.text[:50] if paragraph.text else ''
+                            hint=self._hint(block)
                         ),
                         evidence={
                             'expected': expected_space,
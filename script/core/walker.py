@@ -3,23 +3,22 @@ from __future__ import annotations
 from typing import Iterator
 
 from docx import Document
-from docx.oxml.table import CT_Tbl
-from docx.oxml.text.paragraph import CT_P
+from docx.oxml.ns import qn
 from docx.table import Table
 from docx.text.paragraph import Paragraph
 
 from .model import Block, ParagraphBlock, TableBlock
 
+_TAG_P = qn("w:p")
+_TAG_TBL = qn("w:tbl")
+
 
 class Walker:
     def iter_blocks(self, doc: Document) -> Iterator[Block]:
         body = doc.element.body
-        idx = 0
-        for child in body.iterchildren():
-            if isinstance(child, CT_P):
+        # 由 lxml 按标签过滤，跳过 sectPr、bookmark 等无关子元素
+        for idx, child in enumerate(body.iterchildren(_TAG_P, _TAG_TBL)):
+            if child.tag == _TAG_P:
                 yield ParagraphBlock(idx, Paragraph(child, doc))
-                idx += 1
-            elif isinstance(child, CT_Tbl):
+            else:
                 yield TableBlock(idx, Table(child, doc))
-                idx += 1
-
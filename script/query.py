@@ -7,30 +7,46 @@
 """
 
 import argparse
+import io
+import re
+import sys
+import traceback
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from script.config_loader import ConfigLoader
 from script.core.engine import DocxLint
 from script.core.model import Block, ParagraphBlock, TableBlock
 from script.core.selector import Selector
 
+# 第一个非空白字符（与 str.strip 对空白的判定一致）
+_NON_SPACE_RE = re.compile(r"\S")
 
-def format_block_content(block: Block, max_length: int = 100) -> str:
+
+def format_block_content(block: Block, max_length: Optional[int] = 100) -> str:
     """格式化 block 内容用于显示
     
     Args:
         block: 文档块
-        max_length: 最大显示长度
+        max_length: 最大显示长度（None 表示不截断）
         
     Returns:
         格式化后的内容字符串
     """
     if isinstance(block, ParagraphBlock):
-        content = block.paragraph.text.strip()
-        if len(content) > max_length:
-            content = content[:max_length] + "..."
-        return content
+        text = block.text
+        if max_length is None:
+            return text.strip()
+        
+        # 只截取需要显示的部分，不为整段长文本生成 strip 后的副本
+        first = _NON_SPACE_RE.search(text)
+        if first is None:
+            return ""
+        start = first.start()
+        head = text[start:start + max_length]
+        if _NON_SPACE_RE.search(text, start + max_length):
+            return head + "..."
+        return head.rstrip()
     elif isinstance(block, TableBlock):
         rows = block.table.rows
         cols = len(rows[0].cells) if rows else 0
@@ -39,35 +55,62 @@ def format_block_content(block: Block, max_length: int = 100) -> str:
         return f"<{type(block).__name__}>"
 
 
-def print_blocks(blocks: List[Block], show_classes: bool = True, show_index: bool = True):
+def report_failure(title: str, error: Exception) -> int:
+    """打印失败信息及堆栈
+    
+    Args:
+        title: 失败的步骤描述
+        error: 捕获到的异常
+        
+    Returns:
+        命令行退出码
+    """
+    print(f"❌ {title}: {error}")
+    traceback.print_exc()
+    return 1
+
+
+def print_blocks(
+    blocks: List[Block],
+    show_classes: bool = True,
+    show_index: bool = True,
+    max_length: Optional[int] = 100,
+):
     """打印 block 列表
     
     Args:
         blocks: 文档块列表
         show_classes: 是否显示类名
         show_index: 是否显示索引
+        max_length: 内容最大显示长度（None 表示显示完整内容）
     """
     if not blocks:
         print("❌ 未找到匹配的元素")
         return
     
-    print(f"✅ 找到 {len(blocks)} 个匹配的元素:")
-    print()
+    # 输出先写入缓冲区，最后一次性写到 stdout，避免逐行 print
+    out = io.StringIO()
+    out.write(f"✅ 找到 {len(blocks)} 个匹配的元素:\n\n")
     
     for i, block in enumerate(blocks, 1):
+        # 每个元素拼成一行
+        parts = []
+        
         # 索引
         if show_index:
-            print(f"[{i}]", end=" ")
+            parts.append(f"[{i}]")
         
         # 类名
         if show_classes and block.classes:
             classes_str = ", ".join(block.classes)
-            print(f"({classes_str})", end=" ")
+            parts.append(f"({classes_str})")
         
         # 内容
-        content = format_block_content(block)
-        print(f"{content}")
-        print()
+        parts.append(format_block_content(block, max_length))
+        out.write(" ".join(parts))
+        out.write("\n\n")
+    
+    sys.stdout.write(out.getvalue())
 
 
 def parse_args() -> argparse.Namespace:
@@ -175,26 +218,12 @@ def main() -> int:
     # 分析文档
     print(f"📄 分析文档: {docx_path}")
     try:
-        from docx import Document
-        from script.core.walker import Walker
-        from script.core.classifier import Classifier
-        
-        # 读取文档
-        doc = Document(str(docx_path))
-        blocks = list(Walker().iter_blocks(doc))
-        
-        # 运行分类器
-        document_config = config.get('document', {})
-        if 'classifiers' in document_config:
-            classifier = Classifier(document_config['classifiers'])
-            blocks = classifier.classify(blocks)
-        else:
+        # 读取文档并运行分类器（与检查流程共用）
+        blocks = DocxLint(config).classify(str(docx_path))
+        if 'classifiers' not in config.get('document', {}):
             print("⚠️  配置中没有 classifiers，将无法使用类选择器")
     except Exception as e:
-        print(f"❌ 文档分析失败: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
+        return report_failure("文档分析失败", e)
     
     print(f"✅ 文档共有 {len(blocks)} 个元素")
     print()
@@ -206,6 +235,8 @@ def main() -> int:
     print(f"🔍 查询选择器: {args.selector}")
     print()
     
+    max_length = None if args.full else 100
+    
     try:
         if args.count:
             # 只统计数量
@@ -218,7 +249,8 @@ def main() -> int:
                 print_blocks(
                     [block],
                     show_classes=not args.no_classes,
-                    show_index=not args.no_index
+                    show_index=not args.no_index,
+                    max_length=max_length
                 )
             else:
                 print("❌ 未找到匹配的元素")
@@ -228,13 +260,11 @@ def main() -> int:
             print_blocks(
                 results,
                 show_classes=not args.no_classes,
-                show_index=not args.no_index
+                show_index=not args.no_index,
+                max_length=max_length
             )
     except Exception as e:
-        print(f"❌ 查询失败: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
+        return report_failure("查询失败", e)
     
     return 0
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import asdict
-from typing import List
+from typing import List, TextIO
 
 from script.core.model import Issue
 
@@ -10,3 +10,7 @@ from script.core.model import Issue
 def render_json(issues: List[Issue]) -> str:
     return json.dumps([asdict(i) for i in issues], ensure_ascii=False, indent=2)
 
+
+def write_json(issues: List[Issue], fp: TextIO) -> None:
+    """Write the report to fp chunk by chunk instead of building one large string."""
+    json.dump([asdict(i) for i in issues], fp, ensure_ascii=False, indent=2)
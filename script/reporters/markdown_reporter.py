@@ -1,26 +1,44 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import List
+import io
+from typing import List, TextIO
 
 from script.core.model import Issue
 
+_REPORT_HEADER = "# Docx Lint Report\n\n"
+_NO_ISSUES = _REPORT_HEADER + "No issues found.\n"
+
 
 def render_markdown(issues: List[Issue]) -> str:
+    buf = io.StringIO()
+    write_markdown(issues, buf)
+    return buf.getvalue()
+
+
+def write_markdown(issues: List[Issue], fp: TextIO) -> None:
+    """Write the report to fp piece by piece instead of joining a list of lines."""
     if not issues:
-        return "# Docx Lint Report\n\nNo issues found.\n"
+        fp.write(_NO_ISSUES)
+        return
 
-    lines = ["# Docx Lint Report", ""]
-    for i in issues:
+    # 循环中反复用到的方法和属性先绑定到局部变量
+    write = fp.write
+    write(_REPORT_HEADER)
+    for n, i in enumerate(issues):
+        # 问题之间空一行
+        if n:
+            write("\n")
         loc = i.location
-        lines.append(f"## {i.code} ({i.severity})")
-        lines.append(f"- Location: block_index={loc.block_index}, kind={loc.kind}")
-        lines.append(f"- Hint: {loc.hint}")
-        lines.append(f"- Message: {i.message}")
-        if i.evidence:
-            lines.append("- Evidence:")
-            for k, v in asdict(i).get("evidence", {}).items():
-                lines.append(f"  - {k}: {v}")
-        lines.append("")
-    return "\n".join(lines)
-
+        # 固定的四行一次格式化成一个字符串，不逐行生成再拼接
+        write(
+            f"## {i.code} ({i.severity})\n"
+            f"- Location: block_index={loc.block_index}, kind={loc.kind}\n"
+            f"- Hint: {loc.hint}\n"
+            f"- Message: {i.message}\n"
+        )
+        evidence = i.evidence
+        if evidence:
+            # 直接读取 evidence，不再为每条问题 asdict 深拷贝整个 Issue
+            write("- Evidence:\n")
+            for k, v in evidence.items():
+                write(f"  - {k}: {v}\n")
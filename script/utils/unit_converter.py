@@ -18,8 +18,48 @@
 """
 
 import re
+from functools import lru_cache
 from typing import Union, Optional
 
+# 单位解析用正则（模块加载时编译一次）
+_FONT_SIZE_RE = re.compile(r'^([\d.]+)\s*(pt|磅|号)?$', re.IGNORECASE)
+_SPACING_RE = re.compile(r'^([\d.]+)\s*(\S+)$')
+_LINE_SPACING_RE = re.compile(r'^([\d.]+)\s*(\S+)?$')
+
+# 单位名称集合（磅、厘米、英寸按小写比较，其余区分大小写）
+_FONT_PT_UNITS = frozenset({"pt", "磅"})
+_PT_UNITS = frozenset({"pt", "磅", "点"})
+_LINE_UNITS = frozenset({"行", "line", "lines"})
+_CHAR_UNITS = frozenset({"字符", "字", "char", "chars", "character", "characters"})
+_CM_UNITS = frozenset({"cm", "厘米"})
+_INCH_UNITS = frozenset({"in", "inch", "inches", "英寸"})
+_MULTIPLE_UNITS = frozenset({"倍", "x", "times"})
+_AT_LEAST_UNITS = frozenset({"最少", "atleast"})
+
+# 中文字号（磅），基于 GB/T 9704-2012 国家标准，对应关系如下：
+# 初号(42pt) > 小初(36pt) > 一号(26pt) > 小一(24pt) > 二号(22pt) > 小二(18pt)
+# > 三号(16pt) > 小三(15pt) > 四号(14pt) > 小四(12pt) > 五号(10.5pt) > 小五(9pt)
+# > 六号(7.5pt) > 小六(6.5pt) > 七号(5.5pt) > 八号(5pt)
+_CHINESE_FONT_SIZES = {
+    "初号": 42, "小初": 36,
+    "一号": 26, "小一": 24,
+    "二号": 22, "小二": 18,
+    "三号": 16, "小三": 15,
+    "四号": 14, "小四": 12,
+    "五号": 10.5, "小五": 9,
+    "六号": 7.5, "小六": 6.5,
+    "七号": 5.5, "八号": 5,
+}
+_CHINESE_FONT_SIZE_VALUES = frozenset(_CHINESE_FONT_SIZES.values())
+
+# 行距预设值：名称 -> (行距值, 行距规则)
+_LINE_SPACING_PRESETS = {
+    "单倍": (1.0, "multiple"),
+    "1.5倍": (1.5, "multiple"),
+    "2倍": (2.0, "multiple"),
+    "双倍": (2.0, "multiple"),
+}
+
 
 class UnitConverter:
     """单元转换器
@@ -31,6 +71,9 @@ class UnitConverter:
     - 可以通过 register_font_size_alias() 添加自定义字号别名
     - 可以通过 set_char_width_ratio() 调整字符宽度比例
     - 可以通过 set_line_height_ratio() 调整行高比例
+    
+    解析结果会被缓存（同一个配置值在每个段落上都会被反复解析），
+    修改别名或比例时会自动清空对应的缓存。
     """
     
     # ========== 标准单位转换常量 ==========
@@ -72,6 +115,7 @@ class UnitConverter:
             96  # 48pt * 2
         """
         cls._custom_font_sizes[alias] = pt
+        cls._parse_font_size_str.cache_clear()
     
     @classmethod
     def set_char_width_ratio(cls, ratio: float):
@@ -81,6 +125,7 @@ class UnitConverter:
             ratio: 字符宽度与字号的比例，默认 1.0
         """
         cls.CHAR_WIDTH_RATIO = ratio
+        cls._parse_spacing_str.cache_clear()
     
     @classmethod
     def set_line_height_ratio(cls, ratio: float):
@@ -90,6 +135,7 @@ class UnitConverter:
             ratio: 行高与字号的比例，默认 1.2
         """
         cls.LINE_HEIGHT_RATIO = ratio
+        cls._parse_spacing_str.cache_clear()
     
     @classmethod
     def parse_font_size(cls, value: Union[str, int, float]) -> Optional[int]:
@@ -120,42 +166,34 @@ class UnitConverter:
             return int(value * 2)
             
         value_str = str(value).strip()
-        
+        # 先规范化为字符串再查缓存：列表、字典等不可哈希的配置值
+        # 也能正常走到"无法解析"分支，而不会在缓存键上抛出 TypeError
+        return cls._parse_font_size_str(value_str)
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _parse_font_size_str(cls, value_str: str) -> Optional[int]:
+        """parse_font_size 的字符串部分（按规范化后的字符串缓存）"""
         # 先查找自定义字号别名
         if value_str in cls._custom_font_sizes:
             return int(cls._custom_font_sizes[value_str] * 2)
         
-        # 处理中文字号（基于 GB/T 9704-2012 国家标准）
-        # 这是中国广泛使用的字号标准，对应关系如下：
-        # 初号(42pt) > 小初(36pt) > 一号(26pt) > 小一(24pt) > 二号(22pt) > 小二(18pt)
-        # > 三号(16pt) > 小三(15pt) > 四号(14pt) > 小四(12pt) > 五号(10.5pt) > 小五(9pt)
-        # > 六号(7.5pt) > 小六(6.5pt) > 七号(5.5pt) > 八号(5pt)
-        chinese_sizes = {
-            "初号": 42, "小初": 36,
-            "一号": 26, "小一": 24,
-            "二号": 22, "小二": 18,
-            "三号": 16, "小三": 15,
-            "四号": 14, "小四": 12,
-            "五号": 10.5, "小五": 9,
-            "六号": 7.5, "小六": 6.5,
-            "七号": 5.5, "八号": 5,
-        }
-        
-        if value_str in chinese_sizes:
-            return int(chinese_sizes[value_str] * 2)
+        # 处理中文字号（基于 GB/T 9704-2012 国家标准，见 _CHINESE_FONT_SIZES）
+        if value_str in _CHINESE_FONT_SIZES:
+            return int(_CHINESE_FONT_SIZES[value_str] * 2)
         
         # 处理带单位的字号
         # 匹配数字（整数或小数）+ 可选的单位
-        match = re.match(r'^([\d.]+)\s*(pt|磅|号)?$', value_str, re.IGNORECASE)
+        match = _FONT_SIZE_RE.match(value_str)
         if match:
             number = float(match.group(1))
             unit = match.group(2) or "pt"  # 默认单位是磅
             
-            if unit.lower() in ["pt", "磅"]:
+            if unit.lower() in _FONT_PT_UNITS:
                 return int(number * 2)
             elif unit == "号":
                 # "3号" 表示三号字
-                if number in chinese_sizes.values():
+                if number in _CHINESE_FONT_SIZE_VALUES:
                     return int(number * 2)
         
         # 无法解析
@@ -192,9 +230,15 @@ class UnitConverter:
             return int(value * cls.TWIP_PER_PT)
             
         value_str = str(value).strip()
-        
+        # 同 parse_font_size：先规范化为字符串再查缓存
+        return cls._parse_spacing_str(value_str, font_size)
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _parse_spacing_str(cls, value_str: str, font_size: Optional[float]) -> Optional[int]:
+        """parse_spacing 的字符串部分（按规范化后的字符串缓存）"""
         # 匹配数字（整数或小数）+ 单位
-        match = re.match(r'^([\d.]+)\s*(\S+)$', value_str)
+        match = _SPACING_RE.match(value_str)
         if not match:
             # 尝试纯数字
             try:
@@ -205,13 +249,14 @@ class UnitConverter:
         
         number = float(match.group(1))
         unit = match.group(2)
+        unit_lower = unit.lower()
         
         # 磅
-        if unit.lower() in ["pt", "磅", "点"]:
+        if unit_lower in _PT_UNITS:
             return int(number * cls.TWIP_PER_PT)
         
         # 行
-        if unit in ["行", "line", "lines"]:
+        if unit in _LINE_UNITS:
             if font_size is None:
                 # 如果没有提供字体大小，使用默认值（五号，10.5pt）
                 font_size = 10.5
@@ -219,20 +264,20 @@ class UnitConverter:
             return int(number * line_height * cls.TWIP_PER_PT)
         
         # 字符
-        if unit in ["字符", "字", "char", "chars", "character", "characters"]:
+        if unit in _CHAR_UNITS:
             if font_size is None:
                 font_size = 10.5
             char_width = font_size * cls.CHAR_WIDTH_RATIO
             return int(number * char_width * cls.TWIP_PER_PT)
         
         # 厘米
-        if unit.lower() in ["cm", "厘米"]:
+        if unit_lower in _CM_UNITS:
             # 1cm = 28.35pt
             pt = number * 28.35
             return int(pt * cls.TWIP_PER_PT)
         
         # 英寸
-        if unit.lower() in ["in", "inch", "inches", "英寸"]:
+        if unit_lower in _INCH_UNITS:
             pt = number * cls.PT_PER_INCH
             return int(pt * cls.TWIP_PER_PT)
         
@@ -282,20 +327,19 @@ class UnitConverter:
             return float(value), "multiple"
             
         value_str = str(value).strip()
-        
+        # 同 parse_font_size：先规范化为字符串再查缓存
+        return cls._parse_line_spacing_str(value_str)
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _parse_line_spacing_str(cls, value_str: str) -> tuple[Optional[float], Optional[str]]:
+        """parse_line_spacing 的字符串部分（按规范化后的字符串缓存）"""
         # 预设值
-        presets = {
-            "单倍": (1.0, "multiple"),
-            "1.5倍": (1.5, "multiple"),
-            "2倍": (2.0, "multiple"),
-            "双倍": (2.0, "multiple"),
-        }
-        
-        if value_str in presets:
-            return presets[value_str]
+        if value_str in _LINE_SPACING_PRESETS:
+            return _LINE_SPACING_PRESETS[value_str]
         
         # 匹配数字 + 单位
-        match = re.match(r'^([\d.]+)\s*(\S+)?$', value_str)
+        match = _LINE_SPACING_RE.match(value_str)
         if not match:
             return None, None
         
@@ -303,16 +347,16 @@ class UnitConverter:
         unit = match.group(2) or "倍"  # 默认单位是倍数
         
         # 倍数
-        if unit in ["倍", "x", "times"]:
+        if unit in _MULTIPLE_UNITS:
             return number, "multiple"
         
         # 固定值（磅 -> twip）
-        if unit.lower() in ["pt", "磅", "点"]:
+        if unit.lower() in _PT_UNITS:
             twip = int(number * cls.TWIP_PER_PT)
             return twip, "exact"
         
         # 最小值
-        if unit in ["最少", "atleast"]:
+        if unit in _AT_LEAST_UNITS:
             twip = int(number * cls.TWIP_PER_PT)
             return twip, "atLeast"
         
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Classifier 测试
+
+测试子规则的多轮应用（区间表达式引用后面的兄弟子规则）和唯一定位规则
+"""
+
+from script.core.classifier import Classifier
+from script.core.model import ParagraphBlock
+
+
+class MockParagraph:
+    """模拟的 Paragraph 对象"""
+
+    def __init__(self, text):
+        self.text = text
+
+
+def create_test_blocks(texts):
+    """按文本列表创建测试用的文档块"""
+    return [
+        ParagraphBlock(index=i, paragraph=MockParagraph(text))
+        for i, text in enumerate(texts)
+    ]
+
+
+def test_children_range_refers_to_later_sibling():
+    """测试区间表达式引用后面子规则添加的 class（需要第二轮才能匹配）"""
+    blocks = create_test_blocks(["S 开始", "内容一", "内容二", "S 结束", "正文"])
+
+    rules = [
+        {
+            'class': 'section',
+            'match': {'pattern': '^S'},
+            'children': [
+                # 引用的 start/end 由后面的兄弟子规则添加
+                {
+                    'class': 'section-body',
+                    'match': {'position': {'type': 'relative', 'index': '(section-start, section-end)'}},
+                },
+                {
+                    'class': 'section-start',
+                    'match': {'position': {'type': 'relative', 'index': 0}},
+                },
+                {
+                    'class': 'section-end',
+                    'match': {'position': {'type': 'relative', 'index': -1}},
+                },
+            ],
+        },
+    ]
+
+    Classifier(rules).classify(blocks)
+
+    assert blocks[0].classes == ['section', 'section-start']
+    assert blocks[1].classes == ['section-body']
+    assert blocks[2].classes == ['section-body']
+    assert blocks[3].classes == ['section', 'section-end']
+    assert blocks[4].classes == []
+
+
+def test_next_rule_tags_exactly_one_block():
+    """测试 position: {type: next} 规则只标记锚点后的一个元素"""
+    blocks = create_test_blocks(["标题", "作者", "作者", "摘要"])
+
+    rules = [
+        {
+            'class': 'title',
+            'match': {'position': {'type': 'absolute', 'index': 0}},
+        },
+        {
+            'class': 'author-list',
+            'match': {'position': {'type': 'next', 'class': 'title'}},
+        },
+    ]
+
+    Classifier(rules).classify(blocks)
+
+    tagged = [b.index for b in blocks if b.has_class('author-list')]
+    assert tagged == [1]
+    assert [b.index for b in blocks if b.has_class('title')] == [0]
+
+
+if __name__ == "__main__":
+    test_children_range_refers_to_later_sibling()
+    test_next_rule_tags_exactly_one_block()
+    print("✅ 所有测试通过！")
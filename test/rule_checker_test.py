@@ -8,7 +8,7 @@ RuleChecker 测试
 import sys
 sys.path.insert(0, '/Users/lsl/github/phenix3443/check-word-doc')
 
-from script.core.model import Block, ParagraphBlock
+from script.core.model import Block, ParagraphBlock, Severity
 from script.core.rule_checker import RuleChecker
 
 
@@ -176,6 +176,28 @@ def test_count_equals():
     print("=" * 80)
 
 
+def test_warning_severity():
+    """测试配置中常用的 severity: warning 被解析为 Severity.WARN"""
+    blocks = create_test_blocks()
+    
+    rule = {
+        'id': 'r-exists',
+        'selector': '.abstract',
+        'check': {'exists': True},
+        'severity': 'warning',
+        'message': '缺少摘要'
+    }
+    
+    issues = RuleChecker([rule], blocks).check()
+    assert len(issues) == 1
+    assert issues[0].severity == Severity.WARN
+    
+    # 未配置 severity 时默认为 warning
+    del rule['severity']
+    issues = RuleChecker([rule], blocks).check()
+    assert issues[0].severity == Severity.WARN
+
+
 def test_configuration():
     """测试配置加载"""
     
@@ -178,6 +178,30 @@ def test_adjacent_selector():
     print("\n✅ 相邻兄弟选择器测试通过！\n")
 
 
+def test_sibling_selector():
+    """测试通用兄弟选择器"""
+    print("=" * 60)
+    print("测试: 通用兄弟选择器")
+    print("=" * 60)
+    
+    blocks = create_test_blocks()
+    selector = Selector(blocks)
+    
+    # 引言标题之后的所有参考文献
+    results = selector.select(".heading-introduction ~ .reference-item")
+    print(f"\n选择器: .heading-introduction ~ .reference-item")
+    print(f"结果数量: {len(results)}")
+    assert len(results) == 3, "应该有3条参考文献"
+    
+    # 参考文献标题之前的元素不应被选中
+    results = selector.select(".heading-references ~ .abstract")
+    print(f"\n选择器: .heading-references ~ .abstract")
+    print(f"结果数量: {len(results)}")
+    assert results == [], "摘要在参考文献标题之前"
+    
+    print("\n✅ 通用兄弟选择器测试通过！\n")
+
+
 def test_utility_methods():
     """测试工具方法"""
     print("=" * 60)
@@ -247,6 +271,40 @@ def test_practical_examples():
     print("\n✅ 实际应用示例测试通过！\n")
 
 
+def test_repeated_selector():
+    """测试重复查询同一选择器（解析结果被缓存，但匹配结果随 class 变化）"""
+    print("=" * 60)
+    print("测试6: 重复查询")
+    print("=" * 60)
+    
+    blocks = create_test_blocks()
+    selector = Selector(blocks)
+    
+    assert selector.count(".reference-item") == 3
+    
+    # 修改 class 后再次查询，结果应反映最新状态
+    blocks[0].add_class("reference-item")
+    assert selector.count(".reference-item") == 4, "缓存的只应是解析结果，而非匹配结果"
+    assert selector.select_one(".reference-item") is blocks[0]
+    
+    print("\n✅ 重复查询测试通过！\n")
+
+
+def test_overlapping_selectors():
+    """测试在重叠的元素列表上创建另一个 Selector 后，兄弟关系仍然正确"""
+    blocks = create_test_blocks()
+    selector = Selector(blocks)
+    
+    # 第二个 Selector 会改写共享元素的 index
+    Selector(blocks[1:])
+    
+    result = selector.select_one(".heading-introduction + .body-introduction")
+    assert result is blocks[8], "block.index 被改写后仍应找到相邻元素"
+    
+    results = selector.select(".heading-introduction ~ .reference-item")
+    assert len(results) == 3, "block.index 被改写后仍应找到后续兄弟"
+
+
 if __name__ == "__main__":
     print("\n" + "=" * 60)
     print("开始 Selector 测试")
@@ -255,8 +313,11 @@ if __name__ == "__main__":
     test_class_selector()
     test_pseudo_selector()
     test_adjacent_selector()
+    test_sibling_selector()
     test_utility_methods()
     test_practical_examples()
+    test_repeated_selector()
+    test_overlapping_selectors()
     
     print("=" * 60)
     print("✅ 所有测试通过！")
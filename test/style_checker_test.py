@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+StyleChecker 测试
+
+测试自定义对齐方式别名对问题提示中对齐名称的影响
+"""
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+from script.core.style_checker import StyleChecker
+
+
+def test_reregister_alignment_alias():
+    """测试别名改指其他对齐方式后，原对齐方式不再显示为该别名"""
+    alias = "测试专用对齐"
+    saved_map = dict(StyleChecker.ALIGNMENT_MAP)
+    saved_names = dict(StyleChecker.ALIGNMENT_NAMES)
+    center_name = StyleChecker.ALIGNMENT_NAMES[WD_ALIGN_PARAGRAPH.CENTER]
+
+    try:
+        StyleChecker.register_alignment_alias(alias, WD_ALIGN_PARAGRAPH.CENTER)
+        assert StyleChecker.ALIGNMENT_NAMES[WD_ALIGN_PARAGRAPH.CENTER] == alias
+
+        StyleChecker.register_alignment_alias(alias, WD_ALIGN_PARAGRAPH.LEFT)
+        assert StyleChecker.ALIGNMENT_MAP[alias] == WD_ALIGN_PARAGRAPH.LEFT
+        assert StyleChecker.ALIGNMENT_NAMES[WD_ALIGN_PARAGRAPH.CENTER] == center_name
+        assert StyleChecker.ALIGNMENT_NAMES[WD_ALIGN_PARAGRAPH.LEFT] == alias
+    finally:
+        StyleChecker.ALIGNMENT_MAP.clear()
+        StyleChecker.ALIGNMENT_MAP.update(saved_map)
+        StyleChecker.ALIGNMENT_NAMES = saved_names
+
+
+if __name__ == "__main__":
+    test_reregister_alignment_alias()
+    print("✅ 所有测试通过！")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+UnitConverter 测试
+
+测试单位解析结果及扩展设置（别名、比例）对解析缓存的影响
+"""
+
+from script.utils.unit_converter import UnitConverter
+
+
+def test_parse_font_size():
+    """测试字号解析"""
+    assert UnitConverter.parse_font_size("三号") == 32
+    assert UnitConverter.parse_font_size("16pt") == 32
+    assert UnitConverter.parse_font_size(10.5) == 21
+    assert UnitConverter.parse_font_size("未知字号") is None
+
+
+def test_register_font_size_alias_clears_cache():
+    """测试注册字号别名后，之前缓存的解析结果失效"""
+    alias = "测试专用字号"
+    assert UnitConverter.parse_font_size(alias) is None
+
+    UnitConverter.register_font_size_alias(alias, 48)
+    try:
+        assert UnitConverter.parse_font_size(alias) == 96
+    finally:
+        UnitConverter._custom_font_sizes.pop(alias, None)
+        UnitConverter._parse_font_size_str.cache_clear()
+
+
+def test_set_line_height_ratio_clears_cache():
+    """测试修改行高比例后，按"行"计算的间距随之更新"""
+    original = UnitConverter.LINE_HEIGHT_RATIO
+    assert UnitConverter.parse_spacing("1行", font_size=10) == int(10 * original * 20)
+
+    UnitConverter.set_line_height_ratio(1.5)
+    try:
+        assert UnitConverter.parse_spacing("1行", font_size=10) == 300
+    finally:
+        UnitConverter.set_line_height_ratio(original)
+
+
+def test_unhashable_values_return_none():
+    """测试列表、字典等格式错误的配置值按"无法解析"处理，而不是抛出异常"""
+    for value in ([12], {"pt": 12}):
+        assert UnitConverter.parse_font_size(value) is None
+        assert UnitConverter.parse_spacing(value, font_size=12) is None
+        assert UnitConverter.parse_line_spacing(value) == (None, None)